@@ -1,4 +1,6 @@
 import abc
+import functools
+from typing import Sequence
 
 from TwitchChannelPointsMiner.classes.gql import Error
 
@@ -6,9 +8,8 @@ from TwitchChannelPointsMiner.classes.gql import Error
 class GQLError(abc.ABC, Exception):
     """Abstract base class for GQL errors."""
 
-    def recoverable(self) -> bool:
-        """True if this error can be recovered."""
-        return False
+    recoverable: bool = False
+    """True if this error can be recovered."""
 
 
 class GQLResponseErrors(GQLError):
@@ -20,6 +21,7 @@ class GQLResponseErrors(GQLError):
         self.errors = errors
         """The list of errors in the response."""
 
+    @functools.cached_property
     def recoverable(self):
         # If all the individual Errors are recoverable then this is too
         return all(error.recoverable for error in self.errors)
@@ -39,48 +41,74 @@ class InvalidJsonShapeException(GQLError):
         """The path in the JSON to the unexpected value."""
         self.message = message
         """Information about the unexpected value."""
-
-    def recoverable(self):
-        # This is likely an API change and so can't be recovered
-        return False
+        self._rendered_path: tuple[int, str] | None = None
+        """The length of the path when it was last rendered, and the rendered path."""
+
+    def rendered_path(self) -> str:
+        """The path from the root of the JSON, e.g. `"data", "user", 0`."""
+        # Parent names are appended to the path as the exception propagates, so only reuse a render of the same length
+        if self._rendered_path is None or self._rendered_path[0] != len(self.path):
+            self._rendered_path = (
+                len(self.path),
+                ", ".join(
+                    str(item) if isinstance(item, int) else f'"{item}"'
+                    for item in reversed(self.path)
+                ),
+            )
+        return self._rendered_path[1]
 
     def __str__(self):
-        def render_path_item(item: int | str) -> str:
-            if isinstance(item, int):
-                return str(item)
-            else:
-                return f'"{item}"'
+        return f"JSON at [{self.rendered_path()}] has an invalid shape: {self.message}"
+
+    def __repr__(self):
+        return str(self)
+
+
+class RateLimitedError(GQLError):
+    """Raised when the GQL API asks the client to slow down (HTTP 429 or 503)."""
 
-        return f'JSON at [{", ".join(map(render_path_item, reversed(self.path)))}] has an invalid shape: {self.message}'
+    recoverable = True
+
+    def __init__(self, status_code: int, retry_after: float | None):
+        self.status_code = status_code
+        """The HTTP status code of the response."""
+        self.retry_after = retry_after
+        """The number of seconds the server asked us to wait before retrying, if it said."""
+
+    def __str__(self):
+        if self.retry_after is None:
+            return f"GQL API responded with status code {self.status_code}"
+        return f"GQL API responded with status code {self.status_code}, retry after: {self.retry_after}s"
 
     def __repr__(self):
         return str(self)
 
+    def __eq__(self, other):
+        return (
+            isinstance(other, RateLimitedError)
+            and self.status_code == other.status_code
+            and self.retry_after == other.retry_after
+        )
+
 
 class RetryError(GQLError):
     """Raised when multiple attempts to perform a GQL operation fail."""
 
-    def __init__(self, operation_name: str, errors: list):
+    def __init__(self, operation_name: str, errors: Sequence):
         self.operation_name = operation_name
         """The name of the SQL operation."""
-        self.errors = errors
+        self.errors = tuple(errors)
         """The list of errors that occurred."""
 
     def __str__(self):
-        return f"GQL Operation '{self.operation_name}' failed all {len(self.errors)} attempts, errors:\n{self.errors}"
+        return f"GQL Operation '{self.operation_name}' failed all {len(self.errors)} attempts, errors:\n{list(self.errors)}"
 
     def __repr__(self):
         return str(self)
 
     def __eq__(self, other):
-        if isinstance(other, RetryError):
-            return (
-                self.operation_name == other.operation_name
-                and len(self.errors) == len(other.errors)
-                and all(
-                    self.errors[index] == other.errors[index]
-                    for index in range(len(self.errors))
-                )
-            )
-        else:
-            return False
+        return (
+            isinstance(other, RetryError)
+            and self.operation_name == other.operation_name
+            and self.errors == other.errors
+        )
@@ -1,11 +1,20 @@
-import copy
+import json
 import logging
+import time
 import traceback
-from secrets import token_hex
-from typing import Callable, Any, Protocol
+import uuid
+from concurrent.futures import ThreadPoolExecutor, Future
+from http.cookiejar import DefaultCookiePolicy
+from typing import Callable, Any, Protocol, Mapping, ContextManager
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from TwitchChannelPointsMiner.classes.ClientSession import ClientSession
 from TwitchChannelPointsMiner.classes.Settings import FollowersOrder
@@ -13,6 +22,7 @@ from TwitchChannelPointsMiner.classes.gql.Errors import (
     GQLError,
     RetryError,
     InvalidJsonShapeException,
+    RateLimitedError,
 )
 from TwitchChannelPointsMiner.classes.gql.data.Parser import Parser
 from TwitchChannelPointsMiner.classes.gql.data.response.ChannelPointsContext import (
@@ -40,15 +50,69 @@ from TwitchChannelPointsMiner.classes.gql.data.response.VideoPlayerStreamInfoOve
     VideoPlayerStreamInfoOverlayChannelResponse,
 )
 from TwitchChannelPointsMiner.constants import GQLOperations, CLIENT_ID
-from TwitchChannelPointsMiner.utils import create_chunks
+from TwitchChannelPointsMiner.utils import create_chunks, parse_retry_after
 from TwitchChannelPointsMiner.utils.AttemptStrategy import (
     SuccessResult,
     ErrorResult,
     AttemptStrategy,
+    ExceptionContext,
 )
 
 logger = logging.getLogger(__name__)
 
+_SESSION = requests.Session()
+"""Shared session so GQL requests reuse pooled keep-alive connections."""
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+)
+# The session is shared by every GQL instance (and so every account), so never store cookies from responses
+_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+
+def dumps_json(value: Any) -> bytes:
+    """
+    Serializes the given value to JSON, using orjson if it's installed.
+    :param value: The value to serialize.
+    :return: The JSON as UTF-8 bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode("utf-8")
+
+
+def loads_json(content: bytes) -> Any:
+    """
+    Deserializes the given JSON, using orjson if it's installed.
+    :param content: The JSON as bytes.
+    :return: The deserialized value.
+    :raises requests.exceptions.JSONDecodeError: If the content isn't valid JSON, matching `Response.json()`.
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+    except json.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+def build_payload(template: Mapping[str, Any], variables: dict | None = None) -> dict:
+    """
+    Builds the JSON for a GQL request from one of the `GQLOperations` templates. The templates are shared, so they (and
+    their nested values) are referenced rather than copied and must never be mutated.
+    :param template: The operation template.
+    :param variables: The variables for the request, defaults to the template's own variables (if any).
+    :return: The request JSON.
+    """
+    payload = {
+        "operationName": template["operationName"],
+        "extensions": template["extensions"],
+    }
+    if variables is None:
+        variables = template.get("variables")
+    if variables is not None:
+        payload["variables"] = variables
+    return payload
+
 
 def validate_response(value: Any):
     """
@@ -58,50 +122,75 @@ def validate_response(value: Any):
     return
 
 
+_RECOVERABLE_EXACT = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+"""The most common recoverable exception types, checked by exact type before falling back to `isinstance`."""
+
+
 def is_recoverable_error(e: Exception) -> bool:
     """
     Returns whether the given exception is recoverable.
     :param e: The exception to check.
     :return: True if the exception is recoverable, False otherwise.
     """
-    if isinstance(e, requests.exceptions.RequestException):
+    if type(e) in _RECOVERABLE_EXACT:
         return True
     if isinstance(e, GQLError):
-        return e.recoverable()
-    return False
+        return e.recoverable
+    return isinstance(e, requests.exceptions.RequestException)
 
 
 def error_context(e: Exception) -> str | None:
     """
     Returns a context string (or None) for the given Error. GQLErrors are well understood and so don't need context,
-    anything else is likely a bug and so does need context.
+    anything else is likely a bug and so does need context. Uses the exception's own traceback so it can be called
+    outside the `except` block.
     :param e: The Exception to check.
     :return: The context string, or None if no context is needed.
     """
     if not isinstance(e, GQLError):
-        return traceback.format_exc()
+        return "".join(traceback.format_exception(e))
     else:
         return None
 
 
 def parse_list[T](parse: Callable[[Any], T], value: Any) -> list[T]:
     """
-    Utility for parsing a list
+    Utility for parsing a list, such as a batched response.
     :param parse: Parser for the list item type.
     :param value: The value to parse.
     :return:
     """
     if isinstance(value, list):
         return [parse(item) for item in value]
-    raise InvalidJsonShapeException([], "list expected")
+    raise InvalidJsonShapeException(
+        [], f"Expected list (batched response), got {type(value).__name__}"
+    )
+
+
+def check_batch(length: int, value: Any) -> list:
+    """
+    Utility for checking a batched response has one item for each of the batched requests. The items are left
+    unparsed, so each can be parsed (and fail) separately.
+    :param length: The number of batched requests.
+    :param value: The value to check.
+    :return: The unparsed items.
+    """
+    if isinstance(value, list) and len(value) == length:
+        return value
+    actual = f"{len(value)} items" if isinstance(value, list) else type(value).__name__
+    raise InvalidJsonShapeException(
+        [], f"Expected list (batched response) of {length} items, got {actual}"
+    )
 
 
 class PostRequest(Protocol):
     """For creating Type Hints for a function that posts GQL requests."""
 
-    def __call__(
-        self, url: str, json: dict | list, headers: dict[str, str]
-    ) -> Response: ...
+    def __call__(self, url: str, data: bytes, headers: dict[str, str]) -> Response: ...
 
 
 class GQL:
@@ -115,50 +204,72 @@ class GQL:
         attempt_strategy: AttemptStrategy | None = None,
         parser: Parser | None = None,
         post_request: PostRequest | None = None,
+        max_concurrent_requests: int = 8,
+        cache_ttl_seconds: float = 30,
     ):
         self.client_session = client_session
         """The client session for making requests."""
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "Client-Id": CLIENT_ID,
+            "Client-Session-Id": client_session.session_id,
+            "Client-Version": client_session.version,
+            "User-Agent": client_session.user_agent,
+            "X-Device-Id": client_session.device_id,
+        }
+        """The headers that don't change between requests."""
         self.attempt_strategy = (
             attempt_strategy
             if attempt_strategy is not None
-            else AttemptStrategy(attempts=3, attempt_interval_seconds=1)
+            else AttemptStrategy(attempts=3)
         )
         """Strategy for handling failed requests."""
         self.parser = Parser() if parser is None else parser
         """The parser for parsing GQL responses."""
-        self.post_request = requests.post if post_request is None else post_request
+        self.post_request = _SESSION.post if post_request is None else post_request
         """Function for posting GQL requests."""
+        self._id_cache: dict[str, GetIdFromLoginResponse] = {}
+        """Cache of `get_id_from_login` responses by username."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_requests, thread_name_prefix="GQL"
+        )
+        """Worker threads for making requests concurrently, threads are only started when needed."""
+        self.cache_ttl_seconds = cache_ttl_seconds
+        """How long Inventory and ViewerDropsDashboard responses are reused for, 0 to disable."""
+        self._inventory_cache: tuple[float, InventoryResponse] | None = None
+        """The time (from `time.monotonic`) and response of the last Inventory request."""
+        self._dashboard_cache: tuple[float, ViewerDropsDashboardResponse] | None = None
+        """The time (from `time.monotonic`) and response of the last ViewerDropsDashboard request."""
 
     def __post_gql_request[T](
         self, request_json: dict | list, parse: Callable[[Any], T]
-    ) -> T | list[T]:
+    ) -> T:
         response = self.post_request(
             GQLOperations.url,
-            json=request_json,
+            data=dumps_json(request_json),
             headers={
+                **self._base_headers,
                 "Authorization": f"OAuth {self.client_session.login.get_auth_token()}",
-                "Client-Id": CLIENT_ID,
-                "Client-Session-Id": self.client_session.session_id,
-                "Client-Version": self.client_session.version,
-                "User-Agent": self.client_session.user_agent,
-                "X-Device-Id": self.client_session.device_id,
             },
         )
-        logger.debug(
-            f"Data: {request_json}, Status code: {response.status_code}, Content: {response.text}"
-        )
+        # Avoid formatting the request and decoding the response text unless it'll be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Data: {request_json}, Status code: {response.status_code}, Content: {response.text}"
+            )
+        if response.status_code in (429, 503):
+            raise RateLimitedError(
+                response.status_code,
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
         response.raise_for_status()
-        response_json = response.json()
-        if isinstance(request_json, list):
-            # A batched request should result in a batched response
-            if isinstance(response_json, list):
-                return list(map(parse, response_json))
-            else:
-                raise InvalidJsonShapeException(
-                    [], f"Expected batched response, got {type(response_json).__name__}"
-                )
-        else:
-            return parse(response_json)
+        # For batched requests `parse` is a list parser, which checks the response is batched too
+        return parse(loads_json(response.content))
+
+    def __is_cache_fresh(self, cache: tuple[float, Any] | None) -> bool:
+        return (
+            cache is not None and time.monotonic() - cache[0] < self.cache_ttl_seconds
+        )
 
     @staticmethod
     def __handle_result[T](
@@ -184,7 +295,7 @@ class GQL:
         :param operation_name: The name of the GQL operation.
         :param request_json: The data to send.
         :param parse: The function to use to parse the data.
-        :return: The parsed response, either a single object or a list if the request was a list.
+        :return: The parsed response.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
         result = self.attempt_strategy.make_attempts(
@@ -192,6 +303,8 @@ class GQL:
             validate_response,
             is_recoverable_error,
             error_context,
+            # The errors of a successful result are only ever logged at debug level
+            capture_success_context=logger.isEnabledFor(logging.DEBUG),
         )
         return self.__handle_result(result, operation_name)
 
@@ -203,7 +316,7 @@ class GQL:
         :param operation_name: The name of the GQL operation.
         :param request_json: The data to send as a list of the batched items.
         :param parse: The function to use to parse the data.
-        :return: The parsed response, either a single object or a list if the request was a list.
+        :return: The parsed responses, in the same order as the batched items.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
         result = self.attempt_strategy.make_attempts(
@@ -213,9 +326,100 @@ class GQL:
             validate_response,
             is_recoverable_error,
             error_context,
+            # The errors of a successful result are only ever logged at debug level
+            capture_success_context=logger.isEnabledFor(logging.DEBUG),
         )
         return self.__handle_result(result, operation_name)
 
+    def post_gql_request_mixed_batch(
+        self, batched_requests: list[tuple[str, dict, Callable[[Any], Any]]]
+    ) -> list[Future]:
+        """
+        Posts a batch of different GQL operations as a single request. Each response is parsed separately, so one
+        operation failing doesn't fail the others, and only the operations that failed with a recoverable error are
+        posted again according to the `retry_strategy`.
+        :param batched_requests: The operation name, data, and parse function of each request.
+        :return: A resolved Future for each parsed response, in the same order as the requests. The Futures of
+            operations that failed raise a RetryError with the errors of that operation.
+        """
+        futures = [Future() for _ in batched_requests]
+        # The requests (and their Futures) still waiting for a response, with the errors each one has had so far
+        remaining = [
+            (request, future, []) for request, future in zip(batched_requests, futures)
+        ]
+
+        def fail(operation_name: str, future: Future, errors: list[Exception]):
+            future.set_exception(
+                RetryError(
+                    operation_name,
+                    [ExceptionContext(e, error_context(e)) for e in errors],
+                )
+            )
+
+        def attempt():
+            nonlocal remaining
+            try:
+                responses = self.__post_gql_request(
+                    [request[1] for request, *_ in remaining],
+                    lambda value: check_batch(len(remaining), value),
+                )
+            except Exception as e:
+                # The whole request failed, so it's an error for every operation in it
+                for *_, errors in remaining:
+                    errors.append(e)
+                raise
+            failed = []
+            for (request, future, errors), response in zip(remaining, responses):
+                operation_name, _, parse = request
+                try:
+                    parsed = parse(response)
+                    validate_response(parsed)
+                except Exception as e:
+                    errors.append(e)
+                    if is_recoverable_error(e):
+                        failed.append((request, future, errors))
+                    else:
+                        fail(operation_name, future, errors)
+                else:
+                    future.set_result(parsed)
+            remaining = failed
+            if len(failed) > 0:
+                # Retry just the operations that failed, any of their errors will do to decide how
+                raise failed[0][2][-1]
+
+        if len(remaining) > 0:
+            result = self.attempt_strategy.make_attempts(
+                attempt, validate_response, is_recoverable_error, error_context
+            )
+            if isinstance(result, ErrorResult):
+                for (operation_name, *_), future, errors in remaining:
+                    logger.debug(
+                        f"Unable to make {operation_name} request after {result.attempts} attempts."
+                    )
+                    fail(operation_name, future, errors)
+        return futures
+
+    def batch(self) -> "GQLBatch":
+        """
+        Creates a batch for sending independent read-only operations in one HTTP request. Operations are added to the
+        batch inside a `with` block, each returning a Future for its response, and sent when the block exits.
+        Operations that change state (e.g. `claim_community_points` or `make_prediction`) aren't batched.
+        :return: The batch context manager.
+        """
+        return GQLBatch(self)
+
+    def _video_player_stream_info_overlay_channel_request(
+        self, streamer_username: str
+    ) -> tuple[str, dict, Callable[[Any], VideoPlayerStreamInfoOverlayChannelResponse]]:
+        return (
+            GQLOperations.VideoPlayerStreamInfoOverlayChannel["operationName"],
+            build_payload(
+                GQLOperations.VideoPlayerStreamInfoOverlayChannel,
+                {"channel": streamer_username},
+            ),
+            self.parser.parse_video_player_stream_info_overlay_channel_data,
+        )
+
     def video_player_stream_info_overlay_channel(
         self, streamer_username: str
     ) -> VideoPlayerStreamInfoOverlayChannelResponse:
@@ -225,12 +429,8 @@ class GQL:
         :return: The information.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.VideoPlayerStreamInfoOverlayChannel)
-        json_data["variables"] = {"channel": streamer_username}
         return self.post_gql_request_single(
-            GQLOperations.VideoPlayerStreamInfoOverlayChannel["operationName"],
-            json_data,
-            self.parser.parse_video_player_stream_info_overlay_channel_data,
+            *self._video_player_stream_info_overlay_channel_request(streamer_username)
         )
 
     def get_id_from_login(self, streamer_username: str) -> GetIdFromLoginResponse:
@@ -240,13 +440,21 @@ class GQL:
         :return: The id or an empty string if the user doesn't exist.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.GetIDFromLogin)
-        json_data["variables"]["login"] = streamer_username
-        return self.post_gql_request_single(
+        cached = self._id_cache.get(streamer_username)
+        if cached is not None:
+            return cached
+        json_data = build_payload(
+            GQLOperations.GetIDFromLogin, {"login": streamer_username}
+        )
+        response = self.post_gql_request_single(
             GQLOperations.GetIDFromLogin["operationName"],
             json_data,
             self.parser.parse_get_id_from_login_response,
         )
+        # A user's id never changes, but don't cache missing users as they may be created later
+        if response is not None and response.id != "":
+            self._id_cache[streamer_username] = response
+        return response
 
     def channel_follows(
         self, limit: int = 100, order: FollowersOrder = FollowersOrder.ASC
@@ -258,8 +466,9 @@ class GQL:
         :return: The list of followers, returns none if there was an error.
         :raises RetryError: If one or more errors occurred while attempting the request(s).
         """
-        json_data = copy.deepcopy(GQLOperations.ChannelFollows)
-        json_data["variables"] = {"limit": limit, "order": str(order)}
+        json_data = build_payload(
+            GQLOperations.ChannelFollows, {"limit": limit, "order": str(order)}
+        )
         has_next = True
         last_cursor = ""
         follows: list[str] = []
@@ -275,7 +484,11 @@ class GQL:
                     follow = edge.node
                     follows.append(follow.login)
                     last_cursor = edge.cursor
-                has_next = parsed_response.follows.page_info.has_next_page
+                # Stop if a page has no edges, requesting the same cursor again would never end
+                has_next = (
+                    parsed_response.follows.page_info.has_next_page
+                    and len(parsed_response.follows.edges) > 0
+                )
             else:
                 logger.warning("Unable to get follower list.")
                 return []
@@ -287,14 +500,33 @@ class GQL:
         :param raid_id: The id of the raid to join.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.JoinRaid)
-        json_data["variables"] = {"input": {"raidID": raid_id}}
+        json_data = build_payload(
+            GQLOperations.JoinRaid, {"input": {"raidID": raid_id}}
+        )
         self.post_gql_request_single(
             GQLOperations.JoinRaid["operationName"],
             json_data,
             self.parser.parse_join_raid_response,
         )
 
+    def _get_playback_access_token_request(
+        self, username: str
+    ) -> tuple[str, dict, Callable[[Any], PlaybackAccessTokenResponse]]:
+        return (
+            GQLOperations.PlaybackAccessToken["operationName"],
+            build_payload(
+                GQLOperations.PlaybackAccessToken,
+                {
+                    "login": username,
+                    "isLive": True,
+                    "isVod": False,
+                    "vodID": "",
+                    "playerType": "site",
+                },
+            ),
+            self.parser.parse_playback_access_token_response,
+        )
+
     def get_playback_access_token(self, username: str) -> PlaybackAccessTokenResponse:
         """
         Gets a playback access token for the streamer with the given username.
@@ -302,18 +534,19 @@ class GQL:
         :return: The playback access token.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.PlaybackAccessToken)
-        json_data["variables"] = {
-            "login": username,
-            "isLive": True,
-            "isVod": False,
-            "vodID": "",
-            "playerType": "site",
-        }
         return self.post_gql_request_single(
-            GQLOperations.PlaybackAccessToken["operationName"],
-            json_data,
-            self.parser.parse_playback_access_token_response,
+            *self._get_playback_access_token_request(username)
+        )
+
+    def _get_channel_points_context_request(
+        self, username: str
+    ) -> tuple[str, dict, Callable[[Any], ChannelPointsContextResponse]]:
+        return (
+            GQLOperations.ChannelPointsContext["operationName"],
+            build_payload(
+                GQLOperations.ChannelPointsContext, {"channelLogin": username}
+            ),
+            self.parser.parse_channel_points_context_response,
         )
 
     def get_channel_points_context(self, username: str) -> ChannelPointsContextResponse:
@@ -323,12 +556,8 @@ class GQL:
         :return: The channel points context.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.ChannelPointsContext)
-        json_data["variables"] = {"channelLogin": username}
         return self.post_gql_request_single(
-            GQLOperations.ChannelPointsContext["operationName"],
-            json_data,
-            self.parser.parse_channel_points_context_response,
+            *self._get_channel_points_context_request(username)
         )
 
     def make_prediction(
@@ -342,15 +571,17 @@ class GQL:
         :return: The response.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.MakePrediction)
-        json_data["variables"] = {
-            "input": {
-                "eventID": event_id,
-                "outcomeID": outcome_id,
-                "points": points,
-                "transactionID": token_hex(16),
-            }
-        }
+        json_data = build_payload(
+            GQLOperations.MakePrediction,
+            {
+                "input": {
+                    "eventID": event_id,
+                    "outcomeID": outcome_id,
+                    "points": points,
+                    "transactionID": uuid.uuid4().hex,
+                }
+            },
+        )
         return self.post_gql_request_single(
             GQLOperations.MakePrediction["operationName"],
             json_data,
@@ -364,10 +595,10 @@ class GQL:
         :param claim_id: The id of the claim.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.ClaimCommunityPoints)
-        json_data["variables"] = {
-            "input": {"channelID": channel_id, "claimID": claim_id}
-        }
+        json_data = build_payload(
+            GQLOperations.ClaimCommunityPoints,
+            {"input": {"channelID": channel_id, "claimID": claim_id}},
+        )
         self.post_gql_request_single(
             GQLOperations.ClaimCommunityPoints["operationName"],
             json_data,
@@ -380,14 +611,28 @@ class GQL:
         :param moment_id: The id of the moment to claim.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.CommunityMomentCallout_Claim)
-        json_data["variables"] = {"input": {"momentID": moment_id}}
+        json_data = build_payload(
+            GQLOperations.CommunityMomentCallout_Claim,
+            {"input": {"momentID": moment_id}},
+        )
         self.post_gql_request_single(
             GQLOperations.CommunityMomentCallout_Claim["operationName"],
             json_data,
             self.parser.parse_community_moment_callout_claim_response,
         )
 
+    def _get_available_drops_request(
+        self, channel_id: str
+    ) -> tuple[str, dict, Callable[[Any], DropsHighlightServiceAvailableDropsResponse]]:
+        return (
+            GQLOperations.DropsHighlightService_AvailableDrops["operationName"],
+            build_payload(
+                GQLOperations.DropsHighlightService_AvailableDrops,
+                {"channelID": channel_id},
+            ),
+            self.parser.parse_drops_highlight_service_available_drops,
+        )
+
     def get_available_drops(
         self, channel_id: str
     ) -> DropsHighlightServiceAvailableDropsResponse:
@@ -397,37 +642,41 @@ class GQL:
         :return: The response.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.DropsHighlightService_AvailableDrops)
-        json_data["variables"] = {"channelID": channel_id}
         return self.post_gql_request_single(
-            GQLOperations.DropsHighlightService_AvailableDrops["operationName"],
-            json_data,
-            self.parser.parse_drops_highlight_service_available_drops,
+            *self._get_available_drops_request(channel_id)
         )
 
     def get_inventory(self) -> InventoryResponse:
         """
-        Gets the user's Inventory.
+        Gets the user's Inventory. Responses are reused for `cache_ttl_seconds`.
         :return: The response.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        return self.post_gql_request_single(
+        if self.__is_cache_fresh(self._inventory_cache):
+            return self._inventory_cache[1]
+        response = self.post_gql_request_single(
             GQLOperations.Inventory["operationName"],
-            GQLOperations.Inventory,
+            build_payload(GQLOperations.Inventory),
             self.parser.parse_inventory_response,
         )
+        self._inventory_cache = (time.monotonic(), response)
+        return response
 
     def get_viewer_drops_dashboard(self) -> ViewerDropsDashboardResponse:
         """
-        Gets the viewer drops dashboard.
+        Gets the viewer drops dashboard. Responses are reused for `cache_ttl_seconds`.
         :return: The response.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        return self.post_gql_request_single(
+        if self.__is_cache_fresh(self._dashboard_cache):
+            return self._dashboard_cache[1]
+        response = self.post_gql_request_single(
             GQLOperations.ViewerDropsDashboard["operationName"],
-            GQLOperations.ViewerDropsDashboard,
+            build_payload(GQLOperations.ViewerDropsDashboard),
             self.parser.parse_viewer_drops_dashboard_response,
         )
+        self._dashboard_cache = (time.monotonic(), response)
+        return response
 
     def get_drop_campaign_details(
         self, campaign_ids: list[str]
@@ -439,23 +688,35 @@ class GQL:
         :raises RetryError: If one or more errors occurred while attempting the request(s).
         """
         result = []
+        user_id = f"{self.client_session.login.get_user_id()}"
         # Batch the requests into chunks of 20
         chunks = create_chunks(campaign_ids, 20)
-        for chunk in chunks:
-            json_data = []
-            for campaign in chunk:
-                json_data.append(copy.deepcopy(GQLOperations.DropCampaignDetails))
-                json_data[-1]["variables"] = {
-                    "dropID": campaign,
-                    "channelLogin": f"{self.client_session.login.get_user_id()}",
-                }
-
-            response = self.post_gql_request_batch(
-                GQLOperations.DropCampaignDetails["operationName"],
-                json_data,
-                self.parser.parse_drop_campaign_details_response,
+        payloads = [
+            [
+                build_payload(
+                    GQLOperations.DropCampaignDetails,
+                    {
+                        "dropID": campaign,
+                        "channelLogin": user_id,
+                    },
+                )
+                for campaign in chunk
+            ]
+            for chunk in chunks
+        ]
+        # The chunks are independent so request them concurrently
+        responses = list(
+            self._executor.map(
+                lambda json_data: self.post_gql_request_batch(
+                    GQLOperations.DropCampaignDetails["operationName"],
+                    json_data,
+                    self.parser.parse_drop_campaign_details_response,
+                ),
+                payloads,
             )
+        )
 
+        for response in responses:
             if not isinstance(response, list):
                 logger.debug("Unexpected campaigns response format, skipping chunk")
                 continue
@@ -471,12 +732,29 @@ class GQL:
         :return: The response.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.DropsPage_ClaimDropRewards)
-        json_data["variables"] = {"input": {"dropInstanceID": drop_instance_id}}
-        return self.post_gql_request_single(
-            GQLOperations.DropsPage_ClaimDropRewards["operationName"],
-            json_data,
-            self.parser.parse_drop_page_claim_drop_rewards,
+        json_data = build_payload(
+            GQLOperations.DropsPage_ClaimDropRewards,
+            {"input": {"dropInstanceID": drop_instance_id}},
+        )
+        try:
+            return self.post_gql_request_single(
+                GQLOperations.DropsPage_ClaimDropRewards["operationName"],
+                json_data,
+                self.parser.parse_drop_page_claim_drop_rewards,
+            )
+        finally:
+            # Claiming changes the inventory, and the claim may have worked even if the response couldn't be handled
+            self._inventory_cache = None
+
+    def _get_user_points_contribution_request(
+        self, username: str
+    ) -> tuple[str, dict, Callable[[Any], UserPointsContributionResponse]]:
+        return (
+            GQLOperations.UserPointsContribution["operationName"],
+            build_payload(
+                GQLOperations.UserPointsContribution, {"channelLogin": username}
+            ),
+            self.parser.parse_user_points_contribution,
         )
 
     def get_user_points_contribution(
@@ -488,12 +766,8 @@ class GQL:
         :return: The response.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.UserPointsContribution)
-        json_data["variables"] = {"channelLogin": username}
         return self.post_gql_request_single(
-            GQLOperations.UserPointsContribution["operationName"],
-            json_data,
-            self.parser.parse_user_points_contribution,
+            *self._get_user_points_contribution_request(username)
         )
 
     def contribute_to_community_goal(
@@ -506,15 +780,17 @@ class GQL:
         :param amount: The amount to contribute.
         :raises RetryError: If one or more errors occurred while attempting the request.
         """
-        json_data = copy.deepcopy(GQLOperations.ContributeCommunityPointsCommunityGoal)
-        json_data["variables"] = {
-            "input": {
-                "amount": amount,
-                "channelID": channel_id,
-                "goalID": goal_id,
-                "transactionID": token_hex(16),
-            }
-        }
+        json_data = build_payload(
+            GQLOperations.ContributeCommunityPointsCommunityGoal,
+            {
+                "input": {
+                    "amount": amount,
+                    "channelID": channel_id,
+                    "goalID": goal_id,
+                    "transactionID": uuid.uuid4().hex,
+                }
+            },
+        )
         return self.post_gql_request_single(
             GQLOperations.ContributeCommunityPointsCommunityGoal["operationName"],
             json_data,
@@ -522,6 +798,88 @@ class GQL:
         )
 
 
+class GQLBatch(ContextManager):
+    """
+    Context Manager that collects independent read-only GQL operations and posts them as one batched request on exit.
+    """
+
+    def __init__(self, gql: GQL):
+        self.gql = gql
+        """The GQL instance whose requests are batched."""
+        self.pending: list[tuple[str, dict, Callable[[Any], Any], Future]] = []
+        """The requests waiting to be sent, with the Future for each response."""
+
+    def add[T](
+        self, operation_name: str, request_json: dict, parse: Callable[[Any], T]
+    ) -> Future[T]:
+        """
+        Adds a request to the batch. The request may be posted more than once, so it must not change any state.
+        :param operation_name: The name of the GQL operation.
+        :param request_json: The data to send.
+        :param parse: The function to use to parse the data.
+        :return: A Future for the parsed response, resolved when the batch is sent. Raises a RetryError if one or more
+            errors occurred while attempting the request.
+        """
+        future = Future()
+        self.pending.append((operation_name, request_json, parse, future))
+        return future
+
+    def video_player_stream_info_overlay_channel(
+        self, streamer_username: str
+    ) -> Future[VideoPlayerStreamInfoOverlayChannelResponse]:
+        """Batched version of `GQL.video_player_stream_info_overlay_channel`."""
+        return self.add(
+            *self.gql._video_player_stream_info_overlay_channel_request(
+                streamer_username
+            )
+        )
+
+    def get_playback_access_token(
+        self, username: str
+    ) -> Future[PlaybackAccessTokenResponse]:
+        """Batched version of `GQL.get_playback_access_token`."""
+        return self.add(*self.gql._get_playback_access_token_request(username))
+
+    def get_channel_points_context(
+        self, username: str
+    ) -> Future[ChannelPointsContextResponse]:
+        """Batched version of `GQL.get_channel_points_context`."""
+        return self.add(*self.gql._get_channel_points_context_request(username))
+
+    def get_available_drops(
+        self, channel_id: str
+    ) -> Future[DropsHighlightServiceAvailableDropsResponse]:
+        """Batched version of `GQL.get_available_drops`."""
+        return self.add(*self.gql._get_available_drops_request(channel_id))
+
+    def get_user_points_contribution(
+        self, username: str
+    ) -> Future[UserPointsContributionResponse]:
+        """Batched version of `GQL.get_user_points_contribution`."""
+        return self.add(*self.gql._get_user_points_contribution_request(username))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pending, self.pending = self.pending, []
+        if exc_val is not None:
+            for *_, future in pending:
+                future.cancel()
+            return
+        if len(pending) == 0:
+            return
+        responses = self.gql.post_gql_request_mixed_batch(
+            [request[:3] for request in pending]
+        )
+        for (*_, future), response in zip(pending, responses):
+            exception = response.exception()
+            if exception is None:
+                future.set_result(response.result())
+            else:
+                future.set_exception(exception)
+
+
 class GQLFactory:
     """Factory class for creating GQL objects."""
 
@@ -530,10 +888,14 @@ class GQLFactory:
         attempt_strategy: AttemptStrategy | None = None,
         parser: Parser | None = None,
         post_request: PostRequest | None = None,
+        max_concurrent_requests: int = 8,
+        cache_ttl_seconds: float = 30,
     ):
         self.attempt_strategy = attempt_strategy
         self.parser = parser
         self.post_request = post_request
+        self.max_concurrent_requests = max_concurrent_requests
+        self.cache_ttl_seconds = cache_ttl_seconds
 
     def create(self, client_session: ClientSession) -> GQL:
         """
@@ -542,5 +904,10 @@ class GQLFactory:
         :return: The instance.
         """
         return GQL(
-            client_session, self.attempt_strategy, self.parser, self.post_request
+            client_session,
+            self.attempt_strategy,
+            self.parser,
+            self.post_request,
+            self.max_concurrent_requests,
+            self.cache_ttl_seconds,
         )
@@ -1,6 +1,7 @@
 import logging
+import random
 import time
-from typing import Callable
+from typing import Callable, Sequence
 
 
 logger = logging.getLogger(__name__)
@@ -27,11 +28,15 @@ class ExceptionContext:
         )
 
 
+_NO_ERRORS: tuple[ExceptionContext, ...] = ()
+"""Shared errors value for results without any errors."""
+
+
 class SuccessResult[TResult]:
     """Returned when the result of `make_attempts` was successful."""
 
-    def __init__(self, errors: list[ExceptionContext], result: TResult):
-        self.errors = errors
+    def __init__(self, errors: Sequence[ExceptionContext], result: TResult):
+        self.errors = tuple(errors)
         """Any errors that occurred."""
         self.result = result
         """The result."""
@@ -45,19 +50,18 @@ class SuccessResult[TResult]:
         return f"SuccessResult({self.__dict__})"
 
     def __eq__(self, other):
-        if isinstance(other, SuccessResult) and len(self.errors) == len(other.errors):
-            for index in range(len(self.errors)):
-                if self.errors[index] != other.errors[index]:
-                    return False
-            return self.result == other.result
-        return False
+        return (
+            isinstance(other, SuccessResult)
+            and self.errors == other.errors
+            and self.result == other.result
+        )
 
 
 class ErrorResult:
     """Returned when the result of `make_attempts` was 1 or more errors."""
 
-    def __init__(self, errors: list[ExceptionContext]):
-        self.errors = errors
+    def __init__(self, errors: Sequence[ExceptionContext]):
+        self.errors = tuple(errors)
         """The errors in the order they occurred."""
 
     @property
@@ -69,22 +73,43 @@ class ErrorResult:
         return f"ErrorResult({self.__dict__})"
 
     def __eq__(self, other):
-        if isinstance(other, ErrorResult) and len(self.errors) == len(other.errors):
-            for index in range(len(self.errors)):
-                if self.errors[index] != other.errors[index]:
-                    return False
-            return True
-        return False
+        return isinstance(other, ErrorResult) and self.errors == other.errors
 
 
 class AttemptStrategy:
     """Handles making an attempt at something multiple times by catching Exceptions and validating the Result."""
 
-    def __init__(self, attempts: int = 3, attempt_interval_seconds: int = 1):
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay_seconds: float = 1.0,
+        max_delay_seconds: float = 30.0,
+        jitter: bool = True,
+        attempt_interval_seconds: float | None = None,
+    ):
         self.attempts = attempts
         """The number of attempts that should be made."""
-        self.attempt_interval_seconds = attempt_interval_seconds
-        """The number of seconds to wait between attempts."""
+        self.base_delay_seconds = (
+            base_delay_seconds
+            if attempt_interval_seconds is None
+            else attempt_interval_seconds
+        )
+        """The delay before the first retry, doubled for each subsequent retry."""
+        self.max_delay_seconds = max_delay_seconds
+        """The upper bound on the delay between attempts."""
+        self.jitter = jitter
+        """If True, the delay is randomised between 0 and the backoff delay ("full jitter")."""
+
+    def delay_seconds(self, attempts: int) -> float:
+        """
+        Returns the number of seconds to wait after the given number of failed attempts.
+        :param attempts: The number of attempts made so far.
+        :return: The delay in seconds.
+        """
+        delay = min(
+            self.max_delay_seconds, self.base_delay_seconds * (2 ** (attempts - 1))
+        )
+        return random.random() * delay if self.jitter else delay
 
     def make_attempts[TResult](
         self,
@@ -92,6 +117,7 @@ class AttemptStrategy:
         validate: Callable[[TResult], None],
         retryable: Callable[[Exception], bool],
         exception_context: Callable[[Exception], str | None],
+        capture_success_context: bool = False,
     ) -> SuccessResult | ErrorResult:
         """
         Calls `attempt` up to `self.attempts` times until either a successful attempt is made or the maximum number of
@@ -99,25 +125,67 @@ class AttemptStrategy:
         :param attempt: The functon to attempt.
         :param validate: Function to check if the result is valid. Should throw an Exception if not.
         :param retryable: Function that returns True if a given Error can be retried.
-        :param exception_context: Function that returns a context string (or None) for a given Exception.
+        :param exception_context: Function that returns a context string (or None) for a given Exception. May be called
+            after the Exception has been handled, so it should use the Exception's own traceback.
+        :param capture_success_context: If True, the errors of a successful result have their context captured too.
+            Capturing is expensive, so callers should only set this if they'll log those errors.
         :return:
         """
         attempts = 0
-        errors: list[ExceptionContext] = []
+        # Most attempts succeed first time, so only allocate a list once there's an error
+        exceptions: list[Exception] | None = None
         while attempts < self.attempts:
             attempts += 1
+            retry_after = None
             try:
                 result = attempt()
                 validate(result)
-                return SuccessResult(errors, result)
+                if exceptions is None:
+                    return SuccessResult(_NO_ERRORS, result)
+                return SuccessResult(
+                    self.__exception_contexts(
+                        exceptions, exception_context, capture_success_context
+                    ),
+                    result,
+                )
             except Exception as e:
-                errors.append(ExceptionContext(e, exception_context(e)))
+                if exceptions is None:
+                    exceptions = []
+                exceptions.append(e)
                 if not retryable(e):
                     logger.debug(f"Error cannot be retried: {e}")
                     break
+                # Errors may carry a server-provided delay (e.g. a Retry-After header)
+                retry_after = getattr(e, "retry_after", None)
+                if retry_after is not None and retry_after > self.max_delay_seconds:
+                    # Retrying any sooner would only be refused again
+                    logger.debug(
+                        f"Not retrying, the server asked to wait {retry_after}s: {e}"
+                    )
+                    break
             if attempts >= self.attempts:
                 # Break early to avoid sleeping
                 break
             else:
-                time.sleep(self.attempt_interval_seconds)
-        return ErrorResult(errors)
+                delay = self.delay_seconds(attempts)
+                if retry_after is not None:
+                    # Honour the server's delay, which is at most max_delay_seconds
+                    delay = max(retry_after, delay)
+                time.sleep(delay)
+        return ErrorResult(
+            self.__exception_contexts(exceptions, exception_context, True)
+        )
+
+    @staticmethod
+    def __exception_contexts(
+        exceptions: list[Exception] | None,
+        exception_context: Callable[[Exception], str | None],
+        capture: bool,
+    ) -> tuple[ExceptionContext, ...]:
+        if exceptions is None:
+            return _NO_ERRORS
+        # Capturing the context (usually a stack trace) is the expensive part, so it's deferred until we know it's needed
+        return tuple(
+            ExceptionContext(e, exception_context(e) if capture else None)
+            for e in exceptions
+        )
@@ -1,3 +1,4 @@
+import math
 import platform
 import re
 import secrets
@@ -5,6 +6,7 @@ import socket
 import time
 from copy import deepcopy
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from os import path
 from random import randrange
 from typing import TypeVar, Iterable
@@ -275,3 +277,26 @@ def format_timestamp(timestamp: datetime) -> str:
     """
     return f"{timestamp:%Y-%m-%dT%H:%M:%S}.{timestamp.microsecond // 1000:03d}Z"
 
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses the value of a `Retry-After` header.
+    :param value: The header value, either a number of seconds or an HTTP date.
+    :return: The number of seconds to wait, or None if the header was missing or couldn't be parsed.
+    """
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            # HTTP dates are always UTC, but a "-0000" offset is parsed as naive
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return max(0.0, seconds)
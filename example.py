@@ -121,7 +121,9 @@ twitch_miner = TwitchChannelPointsMiner(
     ),
     gql=AttemptStrategy(
         attempts=3,                             # Number of attempts to make per GQL request
-        attempt_interval_seconds=1              # Number of seconds to wait between attempts
+        base_delay_seconds=1,                   # Delay before the first retry, doubled for each subsequent retry
+        max_delay_seconds=30,                   # Maximum delay between attempts
+        jitter=True                             # Randomise each delay between 0 and the backoff delay
     )
 )
 
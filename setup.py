@@ -39,6 +39,10 @@ setuptools.setup(
         "pandas",
         "pytz"
     ],
+    extras_require={
+        # Faster JSON for GQL requests, the standard json module is used without it
+        "fast": ["orjson"],
+    },
     long_description=read("README.md"),
     long_description_content_type="text/markdown",
     classifiers=[
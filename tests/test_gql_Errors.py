@@ -0,0 +1,19 @@
+from TwitchChannelPointsMiner.classes.gql.Errors import InvalidJsonShapeException
+from TwitchChannelPointsMiner.classes.gql.data.Parser import JsonParentContext
+
+
+class TestInvalidJsonShapeException:
+    def test_str_after_parent_appended(self):
+        exception = InvalidJsonShapeException(["id"], "Expected str")
+        assert str(exception) == 'JSON at ["id"] has an invalid shape: Expected str'
+        # The rendered path is cached, but parents are appended as the exception propagates
+        try:
+            with JsonParentContext(0), JsonParentContext("data"):
+                raise exception
+        except InvalidJsonShapeException:
+            pass
+        assert exception.path == ["id", "data", 0]
+        assert (
+            str(exception)
+            == 'JSON at [0, "data", "id"] has an invalid shape: Expected str'
+        )
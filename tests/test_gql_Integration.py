@@ -0,0 +1,259 @@
+import json
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from TwitchChannelPointsMiner.classes.gql.Errors import (
+    InvalidJsonShapeException,
+    RetryError,
+    GQLError,
+)
+from TwitchChannelPointsMiner.classes.gql.Integration import GQL
+from TwitchChannelPointsMiner.classes.gql.data.response.GetIdFromLogin import (
+    GetIdFromLoginResponse,
+)
+from TwitchChannelPointsMiner.utils.AttemptStrategy import AttemptStrategy
+
+
+class RecoverableError(GQLError):
+    recoverable = True
+
+
+def response(body) -> MagicMock:
+    """Returns a successful Response with the given JSON body."""
+    mock_response = MagicMock(status_code=200, headers={})
+    mock_response.content = json.dumps(body).encode()
+    return mock_response
+
+
+def parse_or_raise(value):
+    """Parses a response item, raising the error named in it (if any)."""
+    if value.startswith("recoverable"):
+        raise RecoverableError(value)
+    if value.startswith("error"):
+        raise ValueError(value)
+    return value
+
+
+def posted_items(post_request: MagicMock) -> list[list]:
+    """Returns the items of each batched request posted."""
+    return [json.loads(c.kwargs["data"]) for c in post_request.call_args_list]
+
+
+@pytest.fixture(autouse=True)
+def sleep():
+    with mock.patch("time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture
+def post_request():
+    return MagicMock()
+
+
+@pytest.fixture
+def gql(post_request):
+    return GQL(
+        MagicMock(),
+        AttemptStrategy(attempts=3, jitter=False),
+        MagicMock(),
+        post_request,
+    )
+
+
+class TestGQLBatch:
+    def test_batch_order(self, gql, post_request):
+        post_request.return_value = response(["a", "b", "c"])
+        with gql.batch() as batch:
+            futures = [batch.add(name, name, parse_or_raise) for name in "abc"]
+            # Nothing is sent until the block exits
+            post_request.assert_not_called()
+        assert [future.result() for future in futures] == ["a", "b", "c"]
+        assert posted_items(post_request) == [["a", "b", "c"]]
+
+    def test_batch_empty(self, gql, post_request):
+        with gql.batch():
+            pass
+        post_request.assert_not_called()
+
+    @pytest.mark.parametrize("body", [["a"], ["a", "b", "c"], {"data": None}])
+    def test_batch_length_mismatch(self, gql, post_request, body):
+        post_request.return_value = response(body)
+        with gql.batch() as batch:
+            futures = [batch.add(name, name, parse_or_raise) for name in "ab"]
+        for future in futures:
+            with pytest.raises(RetryError) as e:
+                future.result()
+            assert isinstance(e.value.errors[0].exception, InvalidJsonShapeException)
+        # The shape of the response is wrong, retrying won't fix it
+        assert post_request.call_count == 1
+
+    def test_batch_item_error(self, gql, post_request):
+        post_request.return_value = response(["a", "error", "c"])
+        with gql.batch() as batch:
+            futures = [batch.add(name, name, parse_or_raise) for name in "abc"]
+        assert futures[0].result() == "a"
+        with pytest.raises(RetryError) as e:
+            futures[1].result()
+        assert e.value.operation_name == "b"
+        assert futures[2].result() == "c"
+        assert post_request.call_count == 1
+
+    def test_batch_retries_only_failed_items(self, gql, post_request):
+        post_request.side_effect = [
+            response(["a", "recoverable", "c"]),
+            response(["b"]),
+        ]
+        with gql.batch() as batch:
+            futures = [batch.add(name, name, parse_or_raise) for name in "abc"]
+        assert [future.result() for future in futures] == ["a", "b", "c"]
+        assert posted_items(post_request) == [["a", "b", "c"], ["b"]]
+
+    def test_batch_item_attempts_exhausted(self, gql, post_request):
+        post_request.side_effect = [
+            response(["a", "recoverable"]),
+            response(["recoverable"]),
+            response(["recoverable"]),
+        ]
+        with gql.batch() as batch:
+            futures = [batch.add(name, name, parse_or_raise) for name in "ab"]
+        assert futures[0].result() == "a"
+        with pytest.raises(RetryError) as e:
+            futures[1].result()
+        assert e.value.operation_name == "b"
+        assert len(e.value.errors) == 3
+        assert posted_items(post_request) == [["a", "b"], ["b"], ["b"]]
+
+    def test_batch_item_errors_are_separate(self, gql, post_request):
+        post_request.side_effect = [
+            requests.exceptions.ConnectionError("down"),
+            response(["a", "recoverable b1", "recoverable c1"]),
+            response(["recoverable b2", "error c2"]),
+        ]
+        with gql.batch() as batch:
+            futures = [batch.add(name, name, parse_or_raise) for name in "abc"]
+        assert futures[0].result() == "a"
+        # Each RetryError has the errors of the whole request and of its own item, but not of the other items
+        for future, expected in [
+            (futures[1], ["down", "recoverable b1", "recoverable b2"]),
+            (futures[2], ["down", "recoverable c1", "error c2"]),
+        ]:
+            with pytest.raises(RetryError) as e:
+                future.result()
+            assert [str(error.exception) for error in e.value.errors] == expected
+        assert posted_items(post_request) == [
+            ["a", "b", "c"],
+            ["a", "b", "c"],
+            ["b", "c"],
+        ]
+
+    def test_batch_exception_in_block(self, gql, post_request):
+        with pytest.raises(ValueError):
+            with gql.batch() as batch:
+                futures = [batch.add(name, name, parse_or_raise) for name in "ab"]
+                raise ValueError()
+        assert all(future.cancelled() for future in futures)
+        post_request.assert_not_called()
+
+    def test_batch_operation(self, gql, post_request):
+        gql.parser.parse_channel_points_context_response = parse_or_raise
+        post_request.return_value = response(["context"])
+        with gql.batch() as batch:
+            future = batch.get_channel_points_context("streamer")
+        assert future.result() == "context"
+        [[item]] = posted_items(post_request)
+        assert item["operationName"] == "ChannelPointsContext"
+        assert item["variables"] == {"channelLogin": "streamer"}
+
+
+@pytest.fixture
+def monotonic():
+    with mock.patch("time.monotonic", return_value=1000.0) as mock_monotonic:
+        yield mock_monotonic
+
+
+class TestGQLCache:
+    # (method, parser function) of each cached operation
+    test_cache_data = [
+        ("get_inventory", "parse_inventory_response"),
+        ("get_viewer_drops_dashboard", "parse_viewer_drops_dashboard_response"),
+    ]
+
+    @pytest.fixture(autouse=True)
+    def parse(self, gql):
+        for _, parser in self.test_cache_data:
+            setattr(gql.parser, parser, parse_or_raise)
+        gql.parser.parse_drop_page_claim_drop_rewards = parse_or_raise
+
+    @pytest.mark.parametrize("method,parser", test_cache_data)
+    def test_fresh(self, gql, post_request, monotonic, method, parser):
+        post_request.return_value = response("first")
+        assert getattr(gql, method)() == "first"
+        post_request.return_value = response("second")
+        monotonic.return_value += 29
+        assert getattr(gql, method)() == "first"
+        assert post_request.call_count == 1
+
+    @pytest.mark.parametrize("method,parser", test_cache_data)
+    def test_expired(self, gql, post_request, monotonic, method, parser):
+        post_request.return_value = response("first")
+        assert getattr(gql, method)() == "first"
+        post_request.return_value = response("second")
+        monotonic.return_value += 30
+        assert getattr(gql, method)() == "second"
+        assert post_request.call_count == 2
+
+    @pytest.mark.parametrize("method,parser", test_cache_data)
+    def test_disabled(self, gql, post_request, monotonic, method, parser):
+        gql.cache_ttl_seconds = 0
+        post_request.return_value = response("first")
+        assert getattr(gql, method)() == "first"
+        post_request.return_value = response("second")
+        assert getattr(gql, method)() == "second"
+        assert post_request.call_count == 2
+
+    def test_claim_drop_rewards_clears_inventory(self, gql, post_request, monotonic):
+        post_request.return_value = response("first")
+        gql.get_inventory()
+        post_request.return_value = response("claimed")
+        assert gql.claim_drop_rewards("drop") == "claimed"
+        post_request.return_value = response("second")
+        assert gql.get_inventory() == "second"
+
+    def test_claim_drop_rewards_error_clears_inventory(
+        self, gql, post_request, monotonic
+    ):
+        post_request.return_value = response("first")
+        gql.get_inventory()
+        # The claim may have worked even though the response couldn't be parsed
+        post_request.return_value = response("error")
+        with pytest.raises(RetryError):
+            gql.claim_drop_rewards("drop")
+        post_request.return_value = response("second")
+        assert gql.get_inventory() == "second"
+
+
+class TestGetIdFromLogin:
+    @pytest.fixture(autouse=True)
+    def parse(self, gql):
+        gql.parser.parse_get_id_from_login_response = GetIdFromLoginResponse
+
+    def test_cached(self, gql, post_request):
+        post_request.return_value = response("1234")
+        assert gql.get_id_from_login("streamer").id == "1234"
+        assert gql.get_id_from_login("streamer").id == "1234"
+        assert post_request.call_count == 1
+        # Other usernames still make a request
+        post_request.return_value = response("5678")
+        assert gql.get_id_from_login("other").id == "5678"
+        assert post_request.call_count == 2
+
+    def test_missing_user_not_cached(self, gql, post_request):
+        post_request.return_value = response("")
+        assert gql.get_id_from_login("streamer").id == ""
+        # The user may be created later, so look them up again
+        post_request.return_value = response("1234")
+        assert gql.get_id_from_login("streamer").id == "1234"
+        assert post_request.call_count == 2
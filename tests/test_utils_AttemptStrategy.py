@@ -0,0 +1,180 @@
+from unittest import mock
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from TwitchChannelPointsMiner.utils.AttemptStrategy import (
+    AttemptStrategy,
+    ErrorResult,
+    ExceptionContext,
+    SuccessResult,
+)
+
+
+class RetryAfterError(Exception):
+    def __init__(self, retry_after: float | None):
+        self.retry_after = retry_after
+
+
+def fail_then_succeed(*errors: Exception) -> MagicMock:
+    """Returns an attempt function that raises each of the errors in turn and then returns "result"."""
+    return MagicMock(side_effect=[*errors, "result"])
+
+
+@pytest.fixture
+def sleep():
+    with mock.patch("time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+class TestResults:
+    error = ExceptionContext(ValueError("error"), None)
+
+    def test_success_result_errors_sequence_type(self):
+        # Results compare equal however their errors were passed in
+        assert SuccessResult([], "result") == SuccessResult((), "result")
+        assert SuccessResult([self.error], "result") == SuccessResult(
+            (self.error,), "result"
+        )
+        assert SuccessResult([self.error], "result") != SuccessResult([], "result")
+        assert SuccessResult([], "result") != SuccessResult([], "other")
+
+    def test_error_result_errors_sequence_type(self):
+        assert ErrorResult([]) == ErrorResult(())
+        assert ErrorResult([self.error]) == ErrorResult((self.error,))
+        assert ErrorResult([self.error]) != ErrorResult([])
+
+    def test_attempts(self):
+        assert SuccessResult((), "result").attempts == 1
+        assert SuccessResult([self.error], "result").attempts == 2
+        assert ErrorResult([self.error, self.error]).attempts == 2
+
+
+class TestAttemptStrategy:
+    test_delay_seconds_data = [
+        (1, 1.0),
+        (2, 2.0),
+        (3, 4.0),
+        (5, 16.0),
+        (6, 30.0),
+        (20, 30.0),
+    ]
+
+    @pytest.mark.parametrize("attempts,expected", test_delay_seconds_data)
+    def test_delay_seconds_without_jitter(self, attempts, expected):
+        strategy = AttemptStrategy(
+            base_delay_seconds=1, max_delay_seconds=30, jitter=False
+        )
+        assert strategy.delay_seconds(attempts) == expected
+
+    @pytest.mark.parametrize("attempts,expected", test_delay_seconds_data)
+    def test_delay_seconds_with_jitter(self, attempts, expected):
+        strategy = AttemptStrategy(base_delay_seconds=1, max_delay_seconds=30)
+        with mock.patch("random.random", return_value=0.5):
+            assert strategy.delay_seconds(attempts) == expected * 0.5
+
+    def test_attempt_interval_seconds_alias(self):
+        strategy = AttemptStrategy(attempt_interval_seconds=2, jitter=False)
+        assert strategy.base_delay_seconds == 2
+        assert strategy.delay_seconds(1) == 2
+
+    def test_make_attempts_success(self, sleep):
+        strategy = AttemptStrategy(attempts=3)
+        result = strategy.make_attempts(
+            lambda: "result", lambda r: None, lambda e: True, lambda e: None
+        )
+        assert result == SuccessResult([], "result")
+        assert result.attempts == 1
+        sleep.assert_not_called()
+
+    def test_make_attempts_backoff(self, sleep):
+        strategy = AttemptStrategy(attempts=3, base_delay_seconds=1, jitter=False)
+        error_1 = ValueError("1")
+        error_2 = ValueError("2")
+        result = strategy.make_attempts(
+            fail_then_succeed(error_1, error_2),
+            lambda r: None,
+            lambda e: True,
+            lambda e: None,
+        )
+        assert result == SuccessResult(
+            [ExceptionContext(error_1, None), ExceptionContext(error_2, None)],
+            "result",
+        )
+        assert sleep.call_args_list == [call(1), call(2)]
+
+    def test_make_attempts_all_fail(self, sleep):
+        strategy = AttemptStrategy(attempts=2, jitter=False)
+        error = ValueError("error")
+        result = strategy.make_attempts(
+            MagicMock(side_effect=error),
+            lambda r: None,
+            lambda e: True,
+            lambda e: "context",
+        )
+        assert result == ErrorResult(
+            [ExceptionContext(error, "context"), ExceptionContext(error, "context")]
+        )
+        # No sleep after the last attempt
+        assert sleep.call_args_list == [call(1)]
+
+    def test_make_attempts_not_retryable(self, sleep):
+        strategy = AttemptStrategy(attempts=3)
+        error = ValueError("error")
+        result = strategy.make_attempts(
+            MagicMock(side_effect=error),
+            lambda r: None,
+            lambda e: False,
+            lambda e: None,
+        )
+        assert result == ErrorResult([ExceptionContext(error, None)])
+        sleep.assert_not_called()
+
+    test_make_attempts_retry_after_data = [
+        # (retry_after, expected sleep), backoff delay is 1 second and the maximum is 30
+        (None, 1),
+        (0.5, 1),
+        (10, 10),
+        (30, 30),
+    ]
+
+    @pytest.mark.parametrize(
+        "retry_after,expected", test_make_attempts_retry_after_data
+    )
+    def test_make_attempts_retry_after(self, sleep, retry_after, expected):
+        strategy = AttemptStrategy(
+            attempts=2, base_delay_seconds=1, max_delay_seconds=30, jitter=False
+        )
+        result = strategy.make_attempts(
+            fail_then_succeed(RetryAfterError(retry_after)),
+            lambda r: None,
+            lambda e: True,
+            lambda e: None,
+        )
+        assert result.result == "result"
+        assert sleep.call_args_list == [call(expected)]
+
+    def test_make_attempts_retry_after_too_long(self, sleep):
+        strategy = AttemptStrategy(attempts=3, max_delay_seconds=30, jitter=False)
+        error = RetryAfterError(3600)
+        attempt = fail_then_succeed(error)
+        result = strategy.make_attempts(
+            attempt, lambda r: None, lambda e: True, lambda e: None
+        )
+        # Retrying before the server's delay has passed would fail again, so give up straight away
+        assert result == ErrorResult([ExceptionContext(error, None)])
+        assert attempt.call_count == 1
+        sleep.assert_not_called()
+
+    @pytest.mark.parametrize("capture,expected", [(False, None), (True, "context")])
+    def test_make_attempts_capture_success_context(self, sleep, capture, expected):
+        strategy = AttemptStrategy(attempts=2, jitter=False)
+        error = ValueError("error")
+        result = strategy.make_attempts(
+            fail_then_succeed(error),
+            lambda r: None,
+            lambda e: True,
+            lambda e: "context",
+            capture_success_context=capture,
+        )
+        assert result == SuccessResult([ExceptionContext(error, expected)], "result")
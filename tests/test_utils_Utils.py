@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+
+from TwitchChannelPointsMiner.utils import Utils
+from TwitchChannelPointsMiner.utils.Utils import parse_retry_after
+
+
+class TestParseRetryAfter:
+    @pytest.fixture(autouse=True)
+    def now(self):
+        # HTTP dates are relative to the current time, so freeze it
+        with mock.patch.object(Utils, "datetime", wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = datetime(
+                2015, 10, 21, 7, 27, 30, tzinfo=timezone.utc
+            )
+            yield
+
+    test_parse_retry_after_data = [
+        (None, None),
+        ("120", 120.0),
+        ("1.5", 1.5),
+        ("-5", 0.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 30.0),
+        ("Wed, 21 Oct 2015 07:28:00 +0000", 30.0),
+        ("Wed, 21 Oct 2015 07:28:00 -0000", 30.0),
+        ("Wed, 21 Oct 2015 07:27:00 GMT", 0.0),
+        ("soon", None),
+        ("", None),
+        ("inf", None),
+        ("-inf", None),
+        ("nan", None),
+    ]
+
+    @pytest.mark.parametrize("value,expected", test_parse_retry_after_data)
+    def test_parse_retry_after(self, value, expected):
+        assert parse_retry_after(value) == expected